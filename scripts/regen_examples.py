@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import math
 import os
-import random
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Optional
 
-import matplotlib.pyplot as plt
+import numpy as np
 
 from wind_clump import (
     FlowParams,
@@ -17,6 +18,7 @@ from wind_clump import (
     build_eisenscript,
     fetch_wind_for_city,
     map_wind_to_flow,
+    map_winds_to_flows,
 )
 
 
@@ -29,46 +31,43 @@ class ExampleSpec:
     fallback_wind: Optional[WindData] = None
 
 
-def _example_specs() -> Iterable[ExampleSpec]:
-    """Curated list of windy scenarios across Beaufort-like bands.
-
-    Each spec includes a fallback `WindData` so we can regenerate documentation
-    assets in a headless CI box without hitting the OpenWeatherMap API. If an
-    API key is present and reachable, we still prefer live data; the fallback
-    keeps the pipeline humming when proxies or missing credentials would
-    otherwise block the docs.
-    """
-
-    return (
-        ExampleSpec(
-            location="Calm Demo,XX",
-            layout="ring",
-            seed=11,
-            label="calm",
-            fallback_wind=WindData(speed_mps=0.8, direction_deg=35.0),
-        ),
-        ExampleSpec(
-            location="Breeze Demo,XX",
-            layout="tower",
-            seed=12,
-            label="breeze",
-            fallback_wind=WindData(speed_mps=4.2, direction_deg=120.0),
-        ),
-        ExampleSpec(
-            location="Fresh Demo,XX",
-            layout="ring",
-            seed=13,
-            label="fresh",
-            fallback_wind=WindData(speed_mps=8.7, direction_deg=205.0),
-        ),
-        ExampleSpec(
-            location="Gale Demo,XX",
-            layout="tower",
-            seed=14,
-            label="gale",
-            fallback_wind=WindData(speed_mps=18.0, direction_deg=315.0),
-        ),
-    )
+# Curated windy scenarios across Beaufort-like bands, built once at import.
+#
+# Each spec includes a fallback `WindData` so we can regenerate documentation
+# assets in a headless CI box without hitting the OpenWeatherMap API. If an
+# API key is present and reachable, we still prefer live data; the fallback
+# keeps the pipeline humming when proxies or missing credentials would
+# otherwise block the docs.
+_EXAMPLE_SPECS: tuple[ExampleSpec, ...] = (
+    ExampleSpec(
+        location="Calm Demo,XX",
+        layout="ring",
+        seed=11,
+        label="calm",
+        fallback_wind=WindData(speed_mps=0.8, direction_deg=35.0),
+    ),
+    ExampleSpec(
+        location="Breeze Demo,XX",
+        layout="tower",
+        seed=12,
+        label="breeze",
+        fallback_wind=WindData(speed_mps=4.2, direction_deg=120.0),
+    ),
+    ExampleSpec(
+        location="Fresh Demo,XX",
+        layout="ring",
+        seed=13,
+        label="fresh",
+        fallback_wind=WindData(speed_mps=8.7, direction_deg=205.0),
+    ),
+    ExampleSpec(
+        location="Gale Demo,XX",
+        layout="tower",
+        seed=14,
+        label="gale",
+        fallback_wind=WindData(speed_mps=18.0, direction_deg=315.0),
+    ),
+)
 
 
 def _scene_slug(spec: ExampleSpec) -> str:
@@ -79,48 +78,111 @@ def _scene_slug(spec: ExampleSpec) -> str:
     )
 
 
-def _render_preview(flow: FlowParams, layout: str, seed: int, output_path: Path) -> None:
-    random.seed(seed)
-    fig = plt.figure(figsize=(6, 6))
-    ax = fig.add_subplot(111, projection="3d")
+# Unit-cube corner offsets and the quad faces connecting them, in the same
+# order bar3d uses. Scaled/broadcast per spike to build one big face batch.
+_CUBE_CORNERS = np.array(
+    [
+        [0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+        [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1],
+    ],
+    dtype=np.float32,
+)
+_CUBE_FACES = np.array(
+    [
+        [0, 1, 2, 3],  # bottom
+        [4, 5, 6, 7],  # top
+        [0, 1, 5, 4],
+        [1, 2, 6, 5],
+        [2, 3, 7, 6],
+        [3, 0, 4, 7],
+    ],
+    dtype=np.intp,
+)
+
+
+# stdout/stderr writes from worker threads interleave without this.
+_PRINT_LOCK = threading.Lock()
+
+
+def _log(message: str, *, err: bool = False) -> None:
+    with _PRINT_LOCK:
+        print(message, file=sys.stderr if err else sys.stdout)
+
+
+# One reusable figure skeleton per worker thread: axes creation is a large
+# share of each preview's cost, and only the spike collection changes between
+# specs. Figures are not shareable across threads, so thread-local it is.
+_THREAD_FIGURE = threading.local()
+
+
+def _figure_and_axes():
+    fig = getattr(_THREAD_FIGURE, "fig", None)
+    if fig is None:
+        # Deferred: matplotlib costs hundreds of ms to import, and runs that
+        # skip previews (or just ask for --help) should not pay for it. The
+        # OO Figure/FigureCanvasAgg pair avoids pyplot's global state, which
+        # is not safe to touch from worker threads.
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(6, 6))
+        FigureCanvasAgg(fig)
+        _THREAD_FIGURE.fig = fig
+        _THREAD_FIGURE.ax = fig.add_subplot(111, projection="3d")
+    return _THREAD_FIGURE.fig, _THREAD_FIGURE.ax
+
+
+def _render_preview(
+    flow: FlowParams,
+    layout: str,
+    seed: int,
+    output_path: Path,
+    preview_dpi: int = 120,
+) -> None:
+    from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+    rng = np.random.default_rng(seed)
+    fig, ax = _figure_and_axes()
+    ax.clear()
 
     clump_count = max(flow.clump_count, 1)
     angle_step = 2 * math.pi / float(clump_count)
     vertical_step = flow.clump_height * 1.4
 
-    for clump_idx in range(clump_count):
-        angle = angle_step * clump_idx
-        base_x, base_y, base_z = 0.0, 0.0, 0.0
-
-        if layout == "ring":
-            base_x = math.cos(angle) * flow.clump_radius
-            base_z = math.sin(angle) * flow.clump_radius
-        else:
-            base_y = vertical_step * clump_idx
-
-        for _ in range(flow.spikes_per_clump):
-            jitter = 0.45 * flow.spike_radius
-            jx = (random.random() - 0.5) * jitter
-            jy = (random.random() - 0.5) * jitter
-            jz = (random.random() - 0.5) * jitter
-
-            length = flow.spike_length * (0.75 + random.random() * 0.35)
-            radius = flow.spike_radius * (0.6 + random.random() * 0.6)
-
-            color_shift = 0.25 + 0.5 * random.random()
-            color = (1.0 - color_shift, 0.4 + 0.4 * color_shift, 0.2 + 0.6 * color_shift)
-
-            ax.bar3d(
-                base_x + jx,
-                base_y + jy,
-                base_z + jz,
-                radius,
-                radius,
-                length,
-                color=color,
-                shade=True,
-                alpha=0.9,
-            )
+    # One batched draw per preview: uniforms for jitter (3), length, radius,
+    # and color shift, then pure array arithmetic instead of per-spike Python.
+    u = rng.random((clump_count, flow.spikes_per_clump, 6), dtype=np.float32)
+    jitter = (u[..., 0:3] - 0.5) * (0.45 * flow.spike_radius)
+    lengths = flow.spike_length * (0.75 + u[..., 3] * 0.35)
+    radii = flow.spike_radius * (0.6 + u[..., 4] * 0.6)
+    color_shift = 0.25 + 0.5 * u[..., 5]
+    colors = np.stack(
+        (1.0 - color_shift, 0.4 + 0.4 * color_shift, 0.2 + 0.6 * color_shift),
+        axis=-1,
+    )
+
+    bases = np.zeros((clump_count, 3), dtype=np.float32)
+    if layout == "ring":
+        angles = np.arange(clump_count) * angle_step
+        bases[:, 0] = np.cos(angles) * flow.clump_radius
+        bases[:, 2] = np.sin(angles) * flow.clump_radius
+    else:
+        bases[:, 1] = vertical_step * np.arange(clump_count)
+
+    # Assemble every spike's six quad faces into one collection so matplotlib
+    # does a single vectorized add instead of one artist per spike.
+    positions = (bases[:, None, :] + jitter).reshape(-1, 3)
+    sizes = np.stack((radii, radii, lengths), axis=-1).reshape(-1, 3)
+    corners = positions[:, None, :] + _CUBE_CORNERS[None, :, :] * sizes[:, None, :]
+    faces = corners[:, _CUBE_FACES, :].reshape(-1, 4, 3)
+
+    rgba = np.empty((positions.shape[0], 4), dtype=np.float32)
+    rgba[:, :3] = colors.reshape(-1, 3)
+    rgba[:, 3] = 0.9
+    facecolors = np.repeat(rgba, len(_CUBE_FACES), axis=0)
+
+    collection = Poly3DCollection(faces, facecolors=facecolors, shade=True)
+    ax.add_collection3d(collection)
 
     spread = max(flow.clump_radius * 1.6, flow.spike_length * 2.0)
     ax.set_xlim(-spread, spread)
@@ -128,78 +190,157 @@ def _render_preview(flow: FlowParams, layout: str, seed: int, output_path: Path)
     ax.set_zlim(0, spread * 1.2)
     ax.view_init(elev=28, azim=40 if layout == "ring" else -35)
     ax.set_axis_off()
-    fig.tight_layout()
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=200, transparent=True)
-    plt.close(fig)
-
+    # bbox_inches crops at save time, so no separate tight_layout pass; the
+    # low zlib level keeps PNG encoding cheap for what are doc thumbnails.
+    fig.savefig(
+        output_path,
+        dpi=preview_dpi,
+        transparent=True,
+        bbox_inches="tight",
+        pad_inches=0,
+        pil_kwargs={"compress_level": 1},
+    )
 
-def main() -> int:
-    api_key = os.environ.get("OPENWEATHER_API_KEY")
 
-    out_dir = Path("generated/examples")
-    out_dir.mkdir(parents=True, exist_ok=True)
+def _fallback_flows(specs: tuple[ExampleSpec, ...]) -> dict[ExampleSpec, FlowParams]:
+    """Map every spec's fallback wind in one vectorized pass.
 
-    for spec in _example_specs():
-        slug = _scene_slug(spec)
-        filename = f"{slug}_{spec.layout}.es"
-        out_path = out_dir / filename
-
-        script_text: str | None = None
-        flow_for_preview: FlowParams | None = None
-
-        if api_key:
-            try:
-                live_wind = fetch_wind_for_city(
-                    location=spec.location,
-                    api_key=api_key,
-                    units="metric",
-                )
-                flow_for_preview = map_wind_to_flow(live_wind)
-                script_text = build_eisenscript(
-                    flow_params=flow_for_preview,
-                    maxdepth=60,
-                    seed=spec.seed,
-                    layout=spec.layout,
-                )
-            except WindAPIError as exc:
-                print(
-                    f"Failed to generate example for {spec.location} [{spec.layout}] via API: {exc}",
-                    file=sys.stderr,
-                )
-                script_text = None
-
-        if script_text is None:
-            if not spec.fallback_wind:
-                print(
-                    f"Skipping {spec.location} [{spec.layout}]: no API key and no fallback wind.",
-                    file=sys.stderr,
-                )
-                continue
-
-            flow_for_preview = map_wind_to_flow(spec.fallback_wind)
+    Struct-of-arrays in, one `FlowParams` per spec out; the per-sample Python
+    banding only runs for live API winds.
+    """
+    with_fallback = [spec for spec in specs if spec.fallback_wind]
+    if not with_fallback:
+        return {}
+
+    speeds = np.array([spec.fallback_wind.speed_mps for spec in with_fallback])
+    directions = np.array(
+        [
+            spec.fallback_wind.direction_deg
+            if spec.fallback_wind.direction_deg is not None
+            else np.nan
+            for spec in with_fallback
+        ]
+    )
+    columns = map_winds_to_flows(speeds, directions)
+
+    flows: dict[ExampleSpec, FlowParams] = {}
+    for idx, spec in enumerate(with_fallback):
+        direction = columns["wind_direction_deg"][idx]
+        flows[spec] = FlowParams(
+            wind_speed_mps=float(columns["wind_speed_mps"][idx]),
+            wind_direction_deg=None if math.isnan(direction) else float(direction),
+            clump_count=int(columns["clump_count"][idx]),
+            spikes_per_clump=int(columns["spikes_per_clump"][idx]),
+            spike_length=float(columns["spike_length"][idx]),
+            spike_radius=float(columns["spike_radius"][idx]),
+            clump_radius=float(columns["clump_radius"][idx]),
+            clump_height=float(columns["clump_height"][idx]),
+            global_twist=float(columns["global_twist"][idx]),
+        )
+    return flows
+
+
+def _process_spec(
+    spec: ExampleSpec,
+    api_key: str | None,
+    out_dir: Path,
+    fallback_flow: FlowParams | None,
+    preview_dpi: int,
+) -> None:
+    slug = _scene_slug(spec)
+    filename = f"{slug}_{spec.layout}.es"
+    out_path = out_dir / filename
+
+    script_text: str | None = None
+    flow_for_preview: FlowParams | None = None
+
+    if api_key:
+        try:
+            live_wind = fetch_wind_for_city(
+                location=spec.location,
+                api_key=api_key,
+                units="metric",
+            )
+            flow_for_preview = map_wind_to_flow(live_wind)
             script_text = build_eisenscript(
                 flow_params=flow_for_preview,
                 maxdepth=60,
                 seed=spec.seed,
                 layout=spec.layout,
             )
-            print(
-                f"Used fallback wind for {spec.location} [{spec.layout}] "
-                f"(speed={spec.fallback_wind.speed_mps} m/s).",
-                file=sys.stderr,
+        except WindAPIError as exc:
+            _log(
+                f"Failed to generate example for {spec.location} [{spec.layout}] via API: {exc}",
+                err=True,
             )
+            script_text = None
+
+    if script_text is None:
+        if fallback_flow is None:
+            _log(
+                f"Skipping {spec.location} [{spec.layout}]: no API key and no fallback wind.",
+                err=True,
+            )
+            return
+
+        flow_for_preview = fallback_flow
+        script_text = build_eisenscript(
+            flow_params=flow_for_preview,
+            maxdepth=60,
+            seed=spec.seed,
+            layout=spec.layout,
+        )
+        _log(
+            f"Used fallback wind for {spec.location} [{spec.layout}] "
+            f"(speed={spec.fallback_wind.speed_mps} m/s).",
+            err=True,
+        )
+
+    # Explicit buffered handle: with several worker threads writing at once,
+    # a roomy buffer keeps each script to a single flush.
+    with open(out_path, "w", encoding="utf-8", buffering=65536) as handle:
+        handle.write(script_text)
+    _log(f"Wrote {out_path} for {spec.location} [{spec.layout}]")
+
+    if flow_for_preview is None:
+        flow_for_preview = fallback_flow
+
+    if flow_for_preview:
+        preview_path = out_dir / "previews" / f"{slug}_{spec.layout}.png"
+        _render_preview(
+            flow_for_preview,
+            layout=spec.layout,
+            seed=spec.seed,
+            output_path=preview_path,
+            preview_dpi=preview_dpi,
+        )
+        _log(f"Wrote preview {preview_path}")
+
 
-        out_path.write_text(script_text, encoding="utf-8")
-        print(f"Wrote {out_path} for {spec.location} [{spec.layout}]")
+def main() -> int:
+    api_key = os.environ.get("OPENWEATHER_API_KEY")
 
-        if flow_for_preview is None:
-            flow_for_preview = map_wind_to_flow(spec.fallback_wind) if spec.fallback_wind else None
+    out_dir = Path("generated/examples")
+    out_dir.mkdir(parents=True, exist_ok=True)
 
-        if flow_for_preview:
-            preview_path = out_dir / "previews" / f"{slug}_{spec.layout}.png"
-            _render_preview(flow_for_preview, layout=spec.layout, seed=spec.seed, output_path=preview_path)
-            print(f"Wrote preview {preview_path}")
+    # Specs are independent: the HTTP fetches overlap on worker threads, and
+    # rendering for one spec proceeds while others wait on sockets.
+    # Previews are doc thumbnails; 120 dpi is plenty and encoding scales with
+    # pixel count. Crank via env when a crisper render is wanted.
+    preview_dpi = int(os.environ.get("WIND_CLUMP_PREVIEW_DPI", "120"))
+
+    specs = _EXAMPLE_SPECS
+    fallback_flows = _fallback_flows(specs)
+    with ThreadPoolExecutor(max_workers=min(8, len(specs))) as executor:
+        list(
+            executor.map(
+                lambda spec: _process_spec(
+                    spec, api_key, out_dir, fallback_flows.get(spec), preview_dpi
+                ),
+                specs,
+            )
+        )
 
     return 0
 
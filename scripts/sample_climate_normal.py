@@ -8,35 +8,98 @@ script samples a lat/long pixel so you can treat multi-year averages as the
 from __future__ import annotations
 
 import argparse
+import csv
 import json
 from pathlib import Path
 from typing import Any
 
-try:
-    import rasterio
-except ImportError as exc:  # pragma: no cover - optional helper
-    raise SystemExit(
-        "rasterio is required for sampling rasters. Install it via `pip install rasterio`."
-    ) from exc
+import numpy as np
+
+
+def _import_rasterio():
+    """Import rasterio only when a raster is actually opened.
+
+    Keeps --help and argparse errors fast, and gives a clear message when the
+    optional dependency is missing.
+    """
+    try:
+        import rasterio
+        from rasterio.windows import Window
+    except ImportError as exc:  # pragma: no cover - optional helper
+        raise SystemExit(
+            "rasterio is required for sampling rasters. Install it via `pip install rasterio`."
+        ) from exc
+    return rasterio, Window
 
 
 def _sample_raster(path: Path, lat: float, lon: float) -> float:
-    """Return the value at lat/lon from a GeoTIFF."""
+    """Return the value at lat/lon from a GeoTIFF.
+
+    Reads a 1x1 window rather than the whole band, so sampling a
+    continental-scale raster costs one pixel of I/O instead of the full grid.
+    """
+    rasterio, Window = _import_rasterio()
     with rasterio.open(path) as dataset:
         row, col = dataset.index(lon, lat)
-        band = dataset.read(1, masked=True)
-        value = band[row, col]
-        if hasattr(value, "mask") and getattr(value, "mask"):
+        if not (0 <= row < dataset.height and 0 <= col < dataset.width):
+            raise RuntimeError(
+                f"Coordinate (lat={lat}, lon={lon}) falls outside this raster."
+            )
+        # Plain read + nodata comparison; building a MaskedArray for one
+        # pixel costs more than the read itself.
+        arr = dataset.read(1, window=Window(col, row, 1, 1))
+        value = float(arr[0, 0])
+        nodata = dataset.nodata
+        if nodata is not None and value == float(nodata):
             raise RuntimeError("The requested coordinate is masked/no-data in this raster.")
-        return float(value)
+        return value
 
 
-def _normalize_anomaly(value: float, min_value: float, max_value: float) -> float:
+def _sample_raster_points(path: Path, coords: list[tuple[float, float]]) -> list[float]:
+    """Sample many (lon, lat) pairs in one dataset open.
+
+    `dataset.sample` streams block-aligned reads, so a survey of N points
+    costs one open plus whatever blocks the points actually touch.
+    """
+    rasterio, _ = _import_rasterio()
+    values: list[float] = []
+    masked_indices: list[int] = []
+    with rasterio.open(path) as dataset:
+        for idx, sampled in enumerate(dataset.sample(coords, masked=True)):
+            if np.ma.is_masked(sampled[0]):
+                masked_indices.append(idx)
+                values.append(float("nan"))
+            else:
+                values.append(float(sampled[0]))
+    if masked_indices:
+        raise RuntimeError(
+            f"{len(masked_indices)} of {len(coords)} points hit masked/no-data "
+            f"pixels (first offender: index {masked_indices[0]})."
+        )
+    return values
+
+
+def _read_points_csv(path: Path) -> list[tuple[float, float]]:
+    """Parse a lat,lon CSV (optional header) into (lon, lat) pairs for rasterio."""
+    coords: list[tuple[float, float]] = []
+    with open(path, newline="", encoding="utf-8") as handle:
+        for row in csv.reader(handle):
+            if not row or row[0].strip().lower() in ("lat", "latitude"):
+                continue
+            lat, lon = float(row[0]), float(row[1])
+            coords.append((lon, lat))
+    if not coords:
+        raise RuntimeError(f"No coordinates found in {path}.")
+    return coords
+
+
+def _normalize_anomaly(values: np.ndarray, min_value: float, max_value: float) -> np.ndarray:
+    """Map raw anomaly values onto [-1, 1]; a degenerate range maps to all zeros."""
+    values = np.asarray(values, dtype=np.float64)
     if max_value == min_value:
-        return 0.0
-    t = (value - min_value) / (max_value - min_value)
-    normalized = (t * 2.0) - 1.0
-    return max(-1.0, min(1.0, normalized))
+        return np.zeros_like(values)
+    t = (values - min_value) / (max_value - min_value)
+    return np.clip(t * 2.0 - 1.0, -1.0, 1.0)
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -48,8 +111,16 @@ def _build_parser() -> argparse.ArgumentParser:
         "--anomaly",
         help="Path to the anomaly GeoTIFF for the same field (optional).",
     )
-    parser.add_argument("--lat", type=float, required=True, help="Latitude in decimal degrees.")
-    parser.add_argument("--lon", type=float, required=True, help="Longitude in decimal degrees.")
+    parser.add_argument("--lat", type=float, help="Latitude in decimal degrees.")
+    parser.add_argument("--lon", type=float, help="Longitude in decimal degrees.")
+    parser.add_argument(
+        "--points",
+        type=Path,
+        help=(
+            "CSV of lat,lon rows (header optional) to sample in one pass. "
+            "Mutually exclusive with --lat/--lon."
+        ),
+    )
     parser.add_argument(
         "--anomaly-min",
         type=float,
@@ -74,40 +145,73 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _build_payload(
+    lat: float,
+    lon: float,
+    normal_value: float,
+    anomaly_value: float | None,
+    normalized_anomaly: float,
+    tag: str,
+) -> dict[str, Any]:
+    cli_snippet = f"--climate-anomaly {normalized_anomaly:.3f} --climate-tag \"{tag}\""
+    return {
+        "lat": lat,
+        "lon": lon,
+        "normal_value": normal_value,
+        "anomaly_value": anomaly_value,
+        "normalized_anomaly": normalized_anomaly,
+        "suggested_cli_flags": cli_snippet,
+    }
+
+
 def main() -> int:
     parser = _build_parser()
     args = parser.parse_args()
 
-    normal_value = _sample_raster(Path(args.normal), lat=args.lat, lon=args.lon)
-
-    anomaly_value: float | None = None
-    normalized_anomaly = 0.0
+    if args.points and (args.lat is not None or args.lon is not None):
+        parser.error("--points cannot be combined with --lat/--lon.")
+    if not args.points and (args.lat is None or args.lon is None):
+        parser.error("Provide either --lat and --lon, or --points.")
+    if args.anomaly and (args.anomaly_min is None or args.anomaly_max is None):
+        parser.error("--anomaly-min and --anomaly-max are required when --anomaly is used.")
+
+    if args.points:
+        coords = _read_points_csv(args.points)
+        normal_values = _sample_raster_points(Path(args.normal), coords)
+    else:
+        coords = [(args.lon, args.lat)]
+        normal_values = [_sample_raster(Path(args.normal), lat=args.lat, lon=args.lon)]
+
+    anomaly_values: list[float | None] = [None] * len(coords)
+    normalized = np.zeros(len(coords))
     if args.anomaly:
-        if args.anomaly_min is None or args.anomaly_max is None:
-            parser.error("--anomaly-min and --anomaly-max are required when --anomaly is used.")
-        anomaly_value = _sample_raster(Path(args.anomaly), lat=args.lat, lon=args.lon)
-        normalized_anomaly = _normalize_anomaly(anomaly_value, args.anomaly_min, args.anomaly_max)
+        if args.points:
+            sampled = _sample_raster_points(Path(args.anomaly), coords)
+        else:
+            sampled = [_sample_raster(Path(args.anomaly), lat=args.lat, lon=args.lon)]
+        anomaly_values = list(sampled)
+        normalized = _normalize_anomaly(sampled, args.anomaly_min, args.anomaly_max)
 
     tag = args.tag or "CLIMATE_NORMAL"
-    cli_snippet = f"--climate-anomaly {normalized_anomaly:.3f} --climate-tag \"{tag}\""
-
-    payload: dict[str, Any] = {
-        "lat": args.lat,
-        "lon": args.lon,
-        "normal_value": normal_value,
-        "anomaly_value": anomaly_value,
-        "normalized_anomaly": normalized_anomaly,
-        "suggested_cli_flags": cli_snippet,
-    }
+    payloads = [
+        _build_payload(lat, lon, normal, anomaly, float(norm), tag)
+        for (lon, lat), normal, anomaly, norm in zip(
+            coords, normal_values, anomaly_values, normalized
+        )
+    ]
+    output_doc: Any = payloads[0] if not args.points else payloads
 
     if args.output:
         args.output.parent.mkdir(parents=True, exist_ok=True)
-        args.output.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-
-    print(json.dumps(payload, indent=2))
-    print()
-    print("Use these flags when calling wind_clump:")
-    print(cli_snippet)
+        args.output.write_text(json.dumps(output_doc, indent=2), encoding="utf-8")
+
+    print(json.dumps(output_doc, indent=2))
+    # In batch mode each payload carries its own suggested_cli_flags; a
+    # single trailing hint would arbitrarily pick one point, so skip it.
+    if not args.points:
+        print()
+        print("Use these flags when calling wind_clump:")
+        print(payloads[0]["suggested_cli_flags"])
     return 0
 
 
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from wind_clump.flow_mapping import FlowParams, map_wind_to_flow
+import math
+
+import numpy as np
+
+from wind_clump.flow_mapping import FlowParams, map_wind_to_flow, map_winds_to_flows
 from wind_clump.wind_api import WindData
 
 
@@ -46,3 +50,27 @@ def test_direction_is_carried_through() -> None:
     params = map_wind_to_flow(wind)
 
     assert params.wind_direction_deg == 123.0
+
+
+def test_batch_mapping_matches_scalar_path() -> None:
+    speeds = [0.0, 0.8, 1.5, 4.2, 7.5, 8.7, 13.5, 18.0, 100.0]
+    directions = [0.0, 35.0, 90.0, 120.0, 180.0, 205.0, 270.0, 315.0, 359.0]
+
+    columns = map_winds_to_flows(np.array(speeds), np.array(directions))
+
+    for idx, (speed, direction) in enumerate(zip(speeds, directions)):
+        scalar = map_wind_to_flow(WindData(speed_mps=speed, direction_deg=direction))
+        assert columns["clump_count"][idx] == scalar.clump_count
+        assert columns["spikes_per_clump"][idx] == scalar.spikes_per_clump
+        assert math.isclose(columns["spike_length"][idx], scalar.spike_length)
+        assert math.isclose(columns["spike_radius"][idx], scalar.spike_radius)
+        assert math.isclose(columns["clump_radius"][idx], scalar.clump_radius)
+        assert math.isclose(columns["clump_height"][idx], scalar.clump_height)
+        assert math.isclose(columns["global_twist"][idx], scalar.global_twist)
+
+
+def test_batch_mapping_accepts_nan_direction() -> None:
+    columns = map_winds_to_flows(np.array([3.5]), np.array([np.nan]))
+
+    assert math.isnan(columns["wind_direction_deg"][0])
+    assert columns["clump_count"][0] >= 1
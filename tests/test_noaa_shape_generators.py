@@ -3,6 +3,7 @@ from __future__ import annotations
 from wind_clump.flow_mapping import FlowParams
 from wind_clump.noaa_shape_generators import (
     NOAAAtmosphere,
+    apply_atmosphere,
     apply_moisture_puffiness,
     apply_pressure_clumping,
 )
@@ -44,4 +45,23 @@ def test_pressure_clumping_increases_density_with_gradient():
 
     assert storm_flow.clump_count > base.clump_count
     assert flat_flow.clump_count <= base.clump_count
-    
\ No newline at end of file
+
+
+def test_apply_atmosphere_matches_chained_warpers():
+    base = _base_flow()
+    stormy = NOAAAtmosphere(
+        precipitation_rate_mm_hr=6.2,
+        humidity_percent=88.0,
+        barometric_pressure_hpa=987.0,
+        lightning_strikes_per_hr=4.0,
+    )
+
+    fused = apply_atmosphere(base, stormy)
+    chained = apply_pressure_clumping(apply_moisture_puffiness(base, stormy), stormy)
+
+    assert fused == chained
+
+
+def test_apply_atmosphere_with_no_data_is_a_no_op():
+    base = _base_flow()
+    assert apply_atmosphere(base, NOAAAtmosphere()) is base
@@ -2,11 +2,12 @@
 Wind-driven EisenScript generator: fetch wind data, map to geometry, emit pointy clumps.
 """
 
-from .wind_api import WindData, WindAPIError, fetch_wind_for_city
-from .flow_mapping import FlowParams, map_wind_to_flow
+from .wind_api import WindData, WindAPIError, fetch_wind_for_city, fetch_wind_for_cities
+from .flow_mapping import FlowParams, map_wind_to_flow, map_winds_to_flows
 from .eisenscript_generator import build_eisenscript
 from .noaa_shape_generators import (
     NOAAAtmosphere,
+    apply_atmosphere,
     apply_moisture_puffiness,
     apply_pressure_clumping,
 )
@@ -30,8 +31,11 @@ __all__ = [
     "WindAPIError",
     "FlowParams",
     "fetch_wind_for_city",
+    "fetch_wind_for_cities",
     "NOAAAtmosphere",
     "map_wind_to_flow",
+    "map_winds_to_flows",
+    "apply_atmosphere",
     "apply_moisture_puffiness",
     "apply_pressure_clumping",
     "build_eisenscript",
@@ -0,0 +1,47 @@
+"""Optional numba-compiled kernel behind `map_winds_to_flows`.
+
+Importing this module raises ImportError when numba is not installed;
+`flow_mapping` catches that and keeps its NumPy path. numba stays out of
+requirements.txt on purpose — it is a heavyweight, occasionally fussy
+install, and the NumPy path is already fast enough for everyday use.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def map_speeds_kernel(
+    speeds: np.ndarray,
+    edges: np.ndarray,
+    band_lo: np.ndarray,
+    band_hi: np.ndarray,
+    params_min: np.ndarray,
+    params_max: np.ndarray,
+) -> np.ndarray:
+    """Band-classify and lerp a batch of speeds in one parallel pass.
+
+    Matches `np.searchsorted(edges, speeds, side="right")` banding exactly,
+    then fuses the clamp and the per-field lerp into the same loop body so
+    nothing round-trips through intermediate arrays.
+    """
+    n = speeds.shape[0]
+    n_fields = params_min.shape[1]
+    out = np.empty((n, n_fields), dtype=np.float64)
+    for i in prange(n):
+        speed = speeds[i]
+        band = 0
+        for j in range(edges.shape[0]):
+            if speed >= edges[j]:
+                band = j + 1
+        t = (speed - band_lo[band]) / (band_hi[band] - band_lo[band])
+        if t < 0.0:
+            t = 0.0
+        elif t > 1.0:
+            t = 1.0
+        for k in range(n_fields):
+            lo = params_min[band, k]
+            out[i, k] = lo + (params_max[band, k] - lo) * t
+    return out
@@ -37,6 +37,11 @@ def _build_parser() -> argparse.ArgumentParser:
         default="metric",
         help="Units for the OpenWeatherAPI (default: metric).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the hourly on-disk wind cache and always hit the API.",
+    )
     parser.add_argument(
         "--maxdepth",
         type=int,
@@ -107,6 +112,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             location=args.location,
             api_key=api_key,
             units=args.units,
+            use_cache=not args.no_cache,
         )
     except WindAPIError as exc:
         print(f"Error fetching wind data: {exc}", file=sys.stderr)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-import random
+import functools
+import secrets
+import string
 from typing import Final
 
 from .flow_mapping import FlowParams
@@ -20,6 +22,106 @@ HEADER_COMMENT: Final[str] = """/*
 */"""
 
 
+_RING_SCENE_RULE: Final[str] = """
+// Start rule: a ring of clumps, wrapped around the origin.
+rule scene {
+  CLUMP_COUNT * {
+    ry ANGLE_STEP
+  } clump
+}
+"""
+
+_TOWER_SCENE_RULE: Final[str] = """
+// Start rule: a vertical tower of clumps, rising with the flow.
+rule scene {
+  CLUMP_COUNT * {
+    y VERTICAL_STEP
+  } clump
+}
+"""
+
+# Shared template source; the per-layout scene rule is baked in below, so
+# each layout gets a fully specialized, branch-free template. EisenScript
+# braces need no escaping here, unlike in the old f-string.
+_SCRIPT_SOURCE: Final[str] = """$header
+
+// Layout: $layout_mode
+
+set maxdepth $maxdepth
+set maxobjects 300000
+set seed $seed_value
+set background #000000
+$climate_block
+// Wind metadata, color anchors, clump geometry
+$numeric_defines
+#define CLUMP_COUNT $clump_count
+#define SPIKES_PER_CLUMP $spikes_per_clump
+$scene_rule
+// Each clump is pushed outward and twisted with the flow.
+rule clump {
+  {
+    ry WIND_DIRECTION_DEG
+    rz GLOBAL_TWIST
+    x CLUMP_RADIUS
+  } spike_cluster
+}
+
+// A clump is a dense cluster of slender spikes.
+rule spike_cluster {
+  SPIKES_PER_CLUMP * {
+    y CLUMP_HEIGHT
+    s SPIKE_RADIUS SPIKE_RADIUS SPIKE_LENGTH
+  } spike
+}
+
+// Pointy spikes: three slight variations, randomly chosen.
+rule spike {
+  { hue BASE_HUE sat 90 b 90 a 90 } box
+}
+
+rule spike w 2 {
+  { ry 10 hue HUE_VARIANT_1 sat 80 b 95 a 85 } box
+}
+
+rule spike w 2 {
+  { ry -10 hue HUE_VARIANT_2 sat 80 b 80 a 80 } box
+}
+"""
+
+_CLIMATE_BLOCK_TEMPLATE: Final[string.Template] = string.Template(
+    "\n// Climate overlay metadata\n$lines\n"
+)
+
+# Define names for the float constants, in the order their values are
+# assembled in `_assemble_script`.
+_NUMERIC_DEFINES: Final[tuple[str, ...]] = (
+    "WIND_SPEED_MPS",
+    "WIND_DIRECTION_DEG",
+    "BASE_HUE",
+    "HUE_VARIANT_1",
+    "HUE_VARIANT_2",
+    "SPIKE_LENGTH",
+    "SPIKE_RADIUS",
+    "CLUMP_RADIUS",
+    "CLUMP_HEIGHT",
+    "GLOBAL_TWIST",
+    "ANGLE_STEP",
+    "VERTICAL_STEP",
+)
+
+# Pre-parsed at import so each build only pays for substitution, not for
+# re-parsing a ~60-line format string. The header and scene rule never vary
+# per call, so both get baked in here rather than substituted every build.
+_TEMPLATES: Final[dict[str, string.Template]] = {
+    layout: string.Template(
+        string.Template(_SCRIPT_SOURCE).safe_substitute(
+            header=HEADER_COMMENT, scene_rule=scene_rule
+        )
+    )
+    for layout, scene_rule in (("ring", _RING_SCENE_RULE), ("tower", _TOWER_SCENE_RULE))
+}
+
+
 def build_eisenscript(
     flow_params: FlowParams,
     maxdepth: int = 60,
@@ -34,44 +136,102 @@ def build_eisenscript(
 
     Optional hue shifting + metadata let you encode climate normals and
     anomalies without changing the clump geometry.
+
+    Once the seed is pinned down the build is fully deterministic, so the
+    public function resolves a missing seed to a fresh random one first and
+    every call goes through an LRU cache keyed on the full argument tuple
+    (`FlowParams` is frozen, so it hashes). Re-renders of the same wind and
+    seed — previews, dashboards polling unchanged weather — become dict
+    lookups. `clear_cache()` resets it.
+    """
+    seed_value = seed if seed is not None else secrets.randbits(31)
+    return _build_cached(
+        flow_params,
+        maxdepth,
+        seed_value,
+        layout,
+        hue_shift_deg,
+        climate_tag,
+        climate_anomaly,
+    )
+
+
+def clear_cache() -> None:
+    """Drop all memoized scripts (for tests and long-running processes)."""
+    _build_cached.cache_clear()
+    _derive.cache_clear()
+
+
+@functools.lru_cache(maxsize=256)
+def _build_cached(
+    flow_params: FlowParams,
+    maxdepth: int,
+    seed: int,
+    layout: str,
+    hue_shift_deg: float,
+    climate_tag: str | None,
+    climate_anomaly: float | None,
+) -> str:
+    return _assemble_script(
+        flow_params,
+        maxdepth,
+        seed,
+        layout,
+        hue_shift_deg,
+        climate_tag,
+        climate_anomaly,
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _derive(
+    flow_params: FlowParams, hue_shift_deg: float
+) -> tuple[float, float, float, float, int, float, float]:
+    """Derived numbers that depend only on the flow and the hue shift.
+
+    Returns (direction, base_hue, hue1, hue2, clump_count, angle_step,
+    vertical_step). Cached separately from the full script so sweeps that
+    vary only seed or maxdepth skip the trig-and-modulo block entirely.
     """
     direction = (
         flow_params.wind_direction_deg if flow_params.wind_direction_deg is not None else 0.0
     )
 
+    # One true modulo normalizes the base; the ±15° variants can only stray
+    # past a wrap point by a single turn, so a compare-and-adjust is enough
+    # and skips two more fmod calls per derivation.
     base_hue = (direction + hue_shift_deg) % 360.0
-    hue1 = (base_hue + 15.0) % 360.0
-    hue2 = (base_hue - 15.0) % 360.0
+    hue1 = base_hue + 15.0
+    if hue1 >= 360.0:
+        hue1 -= 360.0
+    hue2 = base_hue - 15.0
+    if hue2 < 0.0:
+        hue2 += 360.0
 
     clump_count = max(flow_params.clump_count, 1)
     angle_step = 360.0 / float(clump_count)
     vertical_step = flow_params.clump_height * 1.4
 
-    seed_value = seed if seed is not None else random.randint(0, 2**31 - 1)
+    return direction, base_hue, hue1, hue2, clump_count, angle_step, vertical_step
+
+
+def _assemble_script(
+    flow_params: FlowParams,
+    maxdepth: int,
+    seed: int,
+    layout: str,
+    hue_shift_deg: float,
+    climate_tag: str | None,
+    climate_anomaly: float | None,
+) -> str:
+    direction, base_hue, hue1, hue2, clump_count, angle_step, vertical_step = _derive(
+        flow_params, hue_shift_deg
+    )
 
     layout_mode = layout.lower()
-    if layout_mode not in ("ring", "tower"):
+    if layout_mode not in _TEMPLATES:
         layout_mode = "ring"
 
-    if layout_mode == "ring":
-        scene_rule = """
-// Start rule: a ring of clumps, wrapped around the origin.
-rule scene {
-  CLUMP_COUNT * {
-    ry ANGLE_STEP
-  } clump
-}
-"""
-    else:
-        scene_rule = """
-// Start rule: a vertical tower of clumps, rising with the flow.
-rule scene {
-  CLUMP_COUNT * {
-    y VERTICAL_STEP
-  } clump
-}
-"""
-
     climate_lines: list[str] = []
     if climate_tag:
         safe_tag = climate_tag.replace('"', "'")
@@ -80,67 +240,37 @@ rule scene {
         climate_lines.append(f"#define CLIMATE_ANOMALY {climate_anomaly:.3f}")
         climate_lines.append(f"#define HUE_SHIFT_DEG {hue_shift_deg:.3f}")
 
-    climate_block = "\n".join(climate_lines)
-    if climate_block:
-        climate_block = f"\n// Climate overlay metadata\n{climate_block}\n"
-
-    script = f"""{HEADER_COMMENT}
-
-// Layout: {layout_mode}
-
-set maxdepth {maxdepth}
-set maxobjects 300000
-set seed {seed_value}
-set background #000000
-
-// Wind metadata
-#define WIND_SPEED_MPS {flow_params.wind_speed_mps:.3f}
-#define WIND_DIRECTION_DEG {direction:.3f}
-
-{climate_block}// Derived color anchors
-#define BASE_HUE {base_hue:.3f}
-#define HUE_VARIANT_1 {hue1:.3f}
-#define HUE_VARIANT_2 {hue2:.3f}
-
-// Clump geometry
-#define CLUMP_COUNT {clump_count}
-#define SPIKES_PER_CLUMP {flow_params.spikes_per_clump}
-#define SPIKE_LENGTH {flow_params.spike_length:.3f}
-#define SPIKE_RADIUS {flow_params.spike_radius:.3f}
-#define CLUMP_RADIUS {flow_params.clump_radius:.3f}
-#define CLUMP_HEIGHT {flow_params.clump_height:.3f}
-#define GLOBAL_TWIST {flow_params.global_twist:.3f}
-#define ANGLE_STEP {angle_step:.3f}
-#define VERTICAL_STEP {vertical_step:.3f}
-{scene_rule}
-// Each clump is pushed outward and twisted with the flow.
-rule clump {{
-  {{
-    ry WIND_DIRECTION_DEG
-    rz GLOBAL_TWIST
-    x CLUMP_RADIUS
-  }} spike_cluster
-}}
-
-// A clump is a dense cluster of slender spikes.
-rule spike_cluster {{
-  SPIKES_PER_CLUMP * {{
-    y CLUMP_HEIGHT
-    s SPIKE_RADIUS SPIKE_RADIUS SPIKE_LENGTH
-  }} spike
-}}
-
-// Pointy spikes: three slight variations, randomly chosen.
-rule spike {{
-  {{ hue BASE_HUE sat 90 b 90 a 90 }} box
-}}
+    climate_block = ""
+    if climate_lines:
+        climate_block = _CLIMATE_BLOCK_TEMPLATE.substitute(lines="\n".join(climate_lines))
 
-rule spike w 2 {{
-  {{ ry 10 hue HUE_VARIANT_1 sat 80 b 95 a 85 }} box
-}}
+    # All float constants become one joined block of "#define NAME value"
+    # lines, so the template only needs a single placeholder for them.
+    # Values mirror the _NUMERIC_DEFINES name order.
+    values = (
+        flow_params.wind_speed_mps,
+        direction,
+        base_hue,
+        hue1,
+        hue2,
+        flow_params.spike_length,
+        flow_params.spike_radius,
+        flow_params.clump_radius,
+        flow_params.clump_height,
+        flow_params.global_twist,
+        angle_step,
+        vertical_step,
+    )
+    numeric_defines = "\n".join(
+        f"#define {name} {value:.3f}" for name, value in zip(_NUMERIC_DEFINES, values)
+    )
 
-rule spike w 2 {{
-  {{ ry -10 hue HUE_VARIANT_2 sat 80 b 80 a 80 }} box
-}}
-"""
-    return script
+    return _TEMPLATES[layout_mode].substitute(
+        layout_mode=layout_mode,
+        maxdepth=maxdepth,
+        seed_value=seed,
+        climate_block=climate_block,
+        numeric_defines=numeric_defines,
+        clump_count=clump_count,
+        spikes_per_clump=flow_params.spikes_per_clump,
+    )
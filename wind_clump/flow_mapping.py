@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import bisect
+import functools
 from dataclasses import dataclass
+from typing import Final, NamedTuple
+
+import numpy as np
 
 from .wind_api import WindData
 
+try:  # Optional JIT backend; the NumPy batch path below is the fallback.
+    from . import _numba_backend
+except ImportError:  # pragma: no cover - depends on the local environment
+    _numba_backend = None  # type: ignore[assignment]
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FlowParams:
     """Geometry parameters derived from the wind.
 
@@ -31,98 +41,156 @@ class FlowParams:
     global_twist: float
 
 
-def _clamp(value: float, min_value: float, max_value: float) -> float:
-    return max(min_value, min(max_value, value))
-
-
 def _lerp(a: float, b: float, t: float) -> float:
     return a + (b - a) * t
 
 
+_Pair = tuple[float, float]
+
+
+class BandSpec(NamedTuple):
+    """One Beaufort-ish band: its speed range plus a (lo, hi) lerp pair per
+    FlowParams field, in lerp order (radius descends as the wind picks up)."""
+
+    speed_lo: float
+    speed_hi: float
+    clump_count: _Pair
+    spikes_per_clump: _Pair
+    spike_length: _Pair
+    spike_radius: _Pair
+    clump_radius: _Pair
+    clump_height: _Pair
+    global_twist: _Pair
+
+
+# Scalar-path band table: edges in m/s, loosely inspired by Beaufort.
+_SCALAR_BAND_EDGES = (1.5, 7.5, 13.5)
+_BANDS: Final[tuple[BandSpec, ...]] = (
+    # calm
+    BandSpec(0.0, 1.5, (3.0, 5.0), (12.0, 40.0), (0.6, 1.2), (0.32, 0.24), (1.0, 2.0), (0.4, 0.8), (-5.0, 5.0)),
+    # breeze
+    BandSpec(1.5, 7.5, (5.0, 9.0), (40.0, 80.0), (1.2, 2.0), (0.24, 0.18), (2.0, 3.5), (0.8, 1.5), (5.0, 15.0)),
+    # fresh
+    BandSpec(7.5, 13.5, (9.0, 13.0), (80.0, 130.0), (2.0, 3.0), (0.18, 0.11), (3.5, 5.0), (1.5, 2.3), (15.0, 30.0)),
+    # gale
+    BandSpec(13.5, 20.0, (13.0, 18.0), (130.0, 190.0), (3.0, 4.2), (0.11, 0.06), (5.0, 7.0), (2.3, 3.2), (30.0, 50.0)),
+)
+
+
+def _map_wind_scalar(speed: float) -> tuple[float, ...]:
+    """Numeric core of the banded mapping: speed in, seven raw fields out.
+
+    One bisect picks the band row, then every field is a straight lerp.
+    Clamping the norm keeps extreme gales maxed-out at the gale family's
+    top end, same as the old per-band speed clamp. Returns (clump_count,
+    spikes_per_clump, spike_length, spike_radius, clump_radius,
+    clump_height, global_twist) with the counts still un-rounded floats.
+    """
+    band = _BANDS[bisect.bisect_right(_SCALAR_BAND_EDGES, speed)]
+    local_norm = max(
+        0.0, min(1.0, (speed - band.speed_lo) / (band.speed_hi - band.speed_lo))
+    )
+    return tuple(_lerp(lo, hi, local_norm) for lo, hi in band[2:])
+
+
+@functools.lru_cache(maxsize=128)
 def map_wind_to_flow(wind: WindData) -> FlowParams:
     """Map a physical wind measurement onto a family of clumpy, pointy shapes.
 
     Uses Beaufort-like bands so qualitative shifts happen at key thresholds.
+    Both dataclasses are frozen, so identical winds (common across tests and
+    regen sweeps) resolve to a cached `FlowParams` instead of recomputing.
     """
-    speed = max(0.0, float(wind.speed_mps))
-
-    # Band edges in m/s, loosely inspired by Beaufort.
-    if speed < 1.5:
-        band_name = "calm"
-        band_min, band_max = 0.0, 1.5
-    elif speed < 7.5:
-        band_name = "breeze"
-        band_min, band_max = 1.5, 7.5
-    elif speed < 13.5:
-        band_name = "fresh"
-        band_min, band_max = 7.5, 13.5
-    else:
-        band_name = "gale"
-        band_min, band_max = 13.5, 20.0
+    speed = wind.speed_mps  # already clamped non-negative by WindData
 
-    # For shaping we clamp speeds to the band; extreme gales still max-out the "gale" family.
-    shape_speed = _clamp(speed, band_min, band_max)
-    if band_max > band_min:
-        local_norm = (shape_speed - band_min) / (band_max - band_min)
-    else:
-        local_norm = 0.0
-
-    if band_name == "calm":
-        clump_min, clump_max = 3, 5
-        spikes_min, spikes_max = 12, 40
-        length_min, length_max = 0.6, 1.2
-        radius_min, radius_max = 0.32, 0.24
-        radius_min, radius_max = max(radius_min, radius_max), min(radius_min, radius_max)
-        cr_min, cr_max = 1.0, 2.0
-        ch_min, ch_max = 0.4, 0.8
-        twist_min, twist_max = -5.0, 5.0
-    elif band_name == "breeze":
-        clump_min, clump_max = 5, 9
-        spikes_min, spikes_max = 40, 80
-        length_min, length_max = 1.2, 2.0
-        radius_min, radius_max = 0.24, 0.18
-        radius_min, radius_max = max(radius_min, radius_max), min(radius_min, radius_max)
-        cr_min, cr_max = 2.0, 3.5
-        ch_min, ch_max = 0.8, 1.5
-        twist_min, twist_max = 5.0, 15.0
-    elif band_name == "fresh":
-        clump_min, clump_max = 9, 13
-        spikes_min, spikes_max = 80, 130
-        length_min, length_max = 2.0, 3.0
-        radius_min, radius_max = 0.18, 0.11
-        radius_min, radius_max = max(radius_min, radius_max), min(radius_min, radius_max)
-        cr_min, cr_max = 3.5, 5.0
-        ch_min, ch_max = 1.5, 2.3
-        twist_min, twist_max = 15.0, 30.0
-    else:  # gale
-        clump_min, clump_max = 13, 18
-        spikes_min, spikes_max = 130, 190
-        length_min, length_max = 3.0, 4.2
-        radius_min, radius_max = 0.11, 0.06
-        radius_min, radius_max = max(radius_min, radius_max), min(radius_min, radius_max)
-        cr_min, cr_max = 5.0, 7.0
-        ch_min, ch_max = 2.3, 3.2
-        twist_min, twist_max = 30.0, 50.0
-
-    clump_count = int(round(_lerp(clump_min, clump_max, local_norm)))
-    spikes_per_clump = int(round(_lerp(spikes_min, spikes_max, local_norm)))
-
-    spike_length = _lerp(length_min, length_max, local_norm)
-    spike_radius = _lerp(radius_min, radius_max, local_norm)
-
-    clump_radius = _lerp(cr_min, cr_max, local_norm)
-    clump_height = _lerp(ch_min, ch_max, local_norm)
-
-    global_twist = _lerp(twist_min, twist_max, local_norm)
+    clump_count, spikes, spike_length, spike_radius, clump_radius, clump_height, twist = (
+        _map_wind_scalar(speed)
+    )
 
     return FlowParams(
         wind_speed_mps=speed,
         wind_direction_deg=wind.direction_deg,
-        clump_count=clump_count,
-        spikes_per_clump=spikes_per_clump,
+        clump_count=int(round(clump_count)),
+        spikes_per_clump=int(round(spikes)),
         spike_length=spike_length,
         spike_radius=spike_radius,
         clump_radius=clump_radius,
         clump_height=clump_height,
-        global_twist=global_twist,
+        global_twist=twist,
     )
+
+
+# Band tables for the vectorized path. Rows are calm/breeze/fresh/gale;
+# the first two columns are the band's speed range, the remaining columns
+# hold the lerp endpoints for (clump_count, spikes_per_clump, spike_length,
+# spike_radius, clump_radius, clump_height, global_twist), already in lerp
+# order per band (radius descends as the wind picks up). Mirrors the scalar
+# band blocks in `_map_wind_scalar`.
+_BAND_EDGES = np.array([1.5, 7.5, 13.5])
+_BAND_SPEED_LO = np.array([0.0, 1.5, 7.5, 13.5])
+_BAND_SPEED_HI = np.array([1.5, 7.5, 13.5, 20.0])
+_BAND_PARAMS_MIN = np.array(
+    [
+        [3.0, 12.0, 0.6, 0.32, 1.0, 0.4, -5.0],
+        [5.0, 40.0, 1.2, 0.24, 2.0, 0.8, 5.0],
+        [9.0, 80.0, 2.0, 0.18, 3.5, 1.5, 15.0],
+        [13.0, 130.0, 3.0, 0.11, 5.0, 2.3, 30.0],
+    ]
+)
+_BAND_PARAMS_MAX = np.array(
+    [
+        [5.0, 40.0, 1.2, 0.24, 2.0, 0.8, 5.0],
+        [9.0, 80.0, 2.0, 0.18, 3.5, 1.5, 15.0],
+        [13.0, 130.0, 3.0, 0.11, 5.0, 2.3, 30.0],
+        [18.0, 190.0, 4.2, 0.06, 7.0, 3.2, 50.0],
+    ]
+)
+
+
+def map_winds_to_flows(
+    speeds: np.ndarray,
+    directions: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Vectorized `map_wind_to_flow` for a batch of wind samples.
+
+    Takes parallel arrays of speeds (m/s) and directions (degrees; NaN for
+    unknown) and returns a struct-of-arrays dict with one column per
+    `FlowParams` field. Bands are classified with one searchsorted against
+    the shared edges, then every output field comes from a single gathered
+    `lo + (hi - lo) * t` over the parameter tables; the banding matches the
+    scalar path exactly. When numba is installed the classify/lerp step runs
+    through a parallel compiled kernel instead.
+    """
+    speeds = np.maximum(np.asarray(speeds, dtype=np.float64), 0.0)
+    directions = np.asarray(directions, dtype=np.float64)
+
+    if _numba_backend is not None:
+        out = _numba_backend.map_speeds_kernel(
+            speeds,
+            _BAND_EDGES,
+            _BAND_SPEED_LO,
+            _BAND_SPEED_HI,
+            _BAND_PARAMS_MIN,
+            _BAND_PARAMS_MAX,
+        )
+    else:
+        idx = np.searchsorted(_BAND_EDGES, speeds, side="right")
+        band_lo = _BAND_SPEED_LO[idx]
+        band_hi = _BAND_SPEED_HI[idx]
+        t = (np.clip(speeds, band_lo, band_hi) - band_lo) / (band_hi - band_lo)
+
+        mins = _BAND_PARAMS_MIN[idx]
+        maxs = _BAND_PARAMS_MAX[idx]
+        out = mins + (maxs - mins) * t[:, None]
+
+    return {
+        "wind_speed_mps": speeds,
+        "wind_direction_deg": directions,
+        "clump_count": np.rint(out[:, 0]).astype(np.int32),
+        "spikes_per_clump": np.rint(out[:, 1]).astype(np.int32),
+        "spike_length": out[:, 2],
+        "spike_radius": out[:, 3],
+        "clump_radius": out[:, 4],
+        "clump_height": out[:, 5],
+        "global_twist": out[:, 6],
+    }
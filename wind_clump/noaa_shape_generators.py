@@ -5,7 +5,7 @@ from dataclasses import dataclass, replace
 from .flow_mapping import FlowParams
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NOAAAtmosphere:
     """Subset of NOAA-style fields we use to warp the geometry."""
 
@@ -15,72 +15,125 @@ class NOAAAtmosphere:
     lightning_strikes_per_hr: float | None = None
 
 
-def _clamp01(value: float) -> float:
-    return max(0.0, min(1.0, value))
-
-
 def _norm(value: float | None, min_value: float, max_value: float) -> float | None:
     if value is None:
         return None
     if max_value <= min_value:
         return None
-    return _clamp01((float(value) - min_value) / (max_value - min_value))
+    return max(0.0, min(1.0, (float(value) - min_value) / (max_value - min_value)))
 
 
 def _lerp(a: float, b: float, t: float) -> float:
     return a + (b - a) * t
 
 
-def apply_moisture_puffiness(flow: FlowParams, atmosphere: NOAAAtmosphere) -> FlowParams:
-    """Blend precipitation + humidity into the spike radius."""
+def _mix_table(
+    weight_a: float, weight_b: float
+) -> tuple[tuple[float, float, float] | None, ...]:
+    """Weighted-average coefficients per presence mask.
+
+    Index bit 0 = first signal present, bit 1 = second. Each entry holds
+    (weight_a, weight_b, inverse denominator), precomputed so blending two
+    optional signals is a couple of multiplies instead of building a
+    contributions list and summing it twice.
+    """
+    return (
+        None,
+        (weight_a, 0.0, 1.0 / weight_a),
+        (0.0, weight_b, 1.0 / weight_b),
+        (weight_a, weight_b, 1.0 / (weight_a + weight_b)),
+    )
 
+
+_MOISTURE_MIX = _mix_table(0.6, 0.4)  # humidity, precipitation
+_PRESSURE_MIX = _mix_table(0.7, 0.3)  # pressure gradient, lightning
+
+
+def _moisture_radius(flow: FlowParams, atmosphere: NOAAAtmosphere) -> float | None:
+    """Spike radius after the moisture blend, or None if no data to blend."""
     humidity_norm = _norm(atmosphere.humidity_percent, 0.0, 100.0)
     precip_norm = _norm(atmosphere.precipitation_rate_mm_hr, 0.0, 20.0)
 
-    contributions: list[tuple[float, float]] = []
-    if humidity_norm is not None:
-        contributions.append((humidity_norm, 0.6))
-    if precip_norm is not None:
-        contributions.append((precip_norm, 0.4))
-
-    if not contributions:
-        return flow
+    mix = _MOISTURE_MIX[(humidity_norm is not None) | ((precip_norm is not None) << 1)]
+    if mix is None:
+        return None
 
-    weighted = sum(val * weight for val, weight in contributions) / sum(weight for _, weight in contributions)
+    w_humidity, w_precip, inv_den = mix
+    weighted = (
+        w_humidity * (humidity_norm if humidity_norm is not None else 0.0)
+        + w_precip * (precip_norm if precip_norm is not None else 0.0)
+    ) * inv_den
     radius_factor = _lerp(0.75, 1.45, weighted)
-    new_radius = flow.spike_radius * radius_factor
-    return replace(flow, spike_radius=new_radius)
-
+    return flow.spike_radius * radius_factor
 
-def apply_pressure_clumping(flow: FlowParams, atmosphere: NOAAAtmosphere) -> FlowParams:
-    """Use barometric gradients + lightning to remap clump density."""
 
+def _pressure_clump_count(flow: FlowParams, atmosphere: NOAAAtmosphere) -> int | None:
+    """Clump count after the pressure/lightning remap, or None if no data."""
     pressure_norm: float | None = None
     if atmosphere.barometric_pressure_hpa is not None:
         delta = abs(float(atmosphere.barometric_pressure_hpa) - 1013.25)
-        pressure_norm = _clamp01(delta / 35.0)
+        pressure_norm = max(0.0, min(1.0, delta / 35.0))
 
     lightning_norm = _norm(atmosphere.lightning_strikes_per_hr, 0.0, 12.0)
 
-    contributions: list[tuple[float, float]] = []
-    if pressure_norm is not None:
-        contributions.append((pressure_norm, 0.7))
-    if lightning_norm is not None:
-        contributions.append((lightning_norm, 0.3))
-
-    if not contributions:
-        return flow
+    mix = _PRESSURE_MIX[(pressure_norm is not None) | ((lightning_norm is not None) << 1)]
+    if mix is None:
+        return None
 
-    gradient = sum(val * weight for val, weight in contributions) / sum(weight for _, weight in contributions)
+    w_pressure, w_lightning, inv_den = mix
+    gradient = (
+        w_pressure * (pressure_norm if pressure_norm is not None else 0.0)
+        + w_lightning * (lightning_norm if lightning_norm is not None else 0.0)
+    ) * inv_den
 
     min_clumps = max(1, int(round(flow.clump_count * 0.6)))
     max_clumps = max(1, int(round(flow.clump_count * 1.6)))
-    new_clump_count = int(round(_lerp(min_clumps, max_clumps, gradient)))
+    return int(round(_lerp(min_clumps, max_clumps, gradient)))
+
+
+def apply_atmosphere(flow: FlowParams, atmosphere: NOAAAtmosphere) -> FlowParams:
+    """Apply moisture puffiness and pressure clumping in one pass.
+
+    Same math as chaining the two individual warpers, but only one new
+    `FlowParams` gets allocated. Fields with no sensor data leave their
+    geometry untouched.
+    """
+    changes: dict[str, float | int] = {}
+
+    new_radius = _moisture_radius(flow, atmosphere)
+    if new_radius is not None:
+        changes["spike_radius"] = new_radius
+
+    new_clump_count = _pressure_clump_count(flow, atmosphere)
+    if new_clump_count is not None:
+        changes["clump_count"] = new_clump_count
+
+    if not changes:
+        return flow
+    return replace(flow, **changes)
+
+
+def apply_moisture_puffiness(flow: FlowParams, atmosphere: NOAAAtmosphere) -> FlowParams:
+    """Blend precipitation + humidity into the spike radius."""
+
+    new_radius = _moisture_radius(flow, atmosphere)
+    if new_radius is None:
+        return flow
+    return replace(flow, spike_radius=new_radius)
+
+
+def apply_pressure_clumping(flow: FlowParams, atmosphere: NOAAAtmosphere) -> FlowParams:
+    """Use barometric gradients + lightning to remap clump density."""
+
+    new_clump_count = _pressure_clump_count(flow, atmosphere)
+    if new_clump_count is None:
+        return flow
     return replace(flow, clump_count=new_clump_count)
 
 
 __all__ = [
     "NOAAAtmosphere",
+    "apply_atmosphere",
     "apply_moisture_puffiness",
     "apply_pressure_clumping",
 ]
\ No newline at end of file
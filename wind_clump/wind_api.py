@@ -1,25 +1,74 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Final
+import asyncio
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Final, Iterable
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
 
 
 OPENWEATHER_URL: Final[str] = "https://api.openweathermap.org/data/2.5/weather"
 
+DEFAULT_CACHE_DIR: Final[str] = "~/.cache/wind_clump"
+
+
+def _build_session() -> requests.Session:
+    """One shared session so repeated fetches reuse the TLS connection.
+
+    A fresh requests.get pays DNS + TCP + TLS handshake every call; keep-alive
+    drops that to a single round-trip, which dominates when regenerating many
+    scenes back to back.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION: requests.Session = _build_session()
+
+
+def close_session() -> None:
+    """Close the shared HTTP session (and let the next fetch rebuild it)."""
+    global _SESSION
+    _SESSION.close()
+    _SESSION = _build_session()
+
 
 class WindAPIError(Exception):
     """Raised when anything goes wrong while talking to the weather API."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WindData:
-    """Wind speed and direction in a consistent, geometry-friendly form."""
+    """Wind speed and direction in a consistent, geometry-friendly form.
+
+    The speed is coerced to a non-negative float at construction, so
+    downstream consumers can rely on the invariant instead of re-clamping.
+    """
 
     speed_mps: float
     direction_deg: float | None
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "speed_mps", max(0.0, float(self.speed_mps)))
+
 
 def _convert_speed_to_mps(speed: float, units: str) -> float:
     """Convert the API's wind speed into meters per second."""
@@ -28,13 +77,88 @@ def _convert_speed_to_mps(speed: float, units: str) -> float:
     return speed
 
 
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a response body, via orjson when it is installed.
+
+    orjson's SIMD parser is markedly faster than the stdlib on batch
+    fetches; both raise a ValueError subclass on bad input, so callers
+    catch the same thing either way.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+def _cache_path(location: str, units: str) -> Path:
+    """Hourly-bucketed cache file for a (location, units) pair.
+
+    Folding the hour into the key means stale entries simply stop matching;
+    no explicit eviction needed.
+    """
+    cache_dir = Path(os.environ.get("WIND_CLUMP_CACHE", DEFAULT_CACHE_DIR)).expanduser()
+    key = f"{location}|{units}|{int(time.time() // 3600)}"
+    return cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+
+def _read_cached_wind(path: Path) -> WindData | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return WindData(**data)
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _write_cached_wind(path: Path, wind: WindData) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(asdict(wind)), encoding="utf-8")
+    except OSError:
+        # A broken cache dir should never take down a successful fetch.
+        pass
+
+
 def fetch_wind_for_city(
     location: str,
     api_key: str,
     units: str = "metric",
     timeout: float = 10.0,
+    use_cache: bool = True,
+    session: requests.Session | None = None,
+) -> WindData:
+    """Fetch current wind speed and direction for a city from OpenWeatherMap.
+
+    Results are cached on disk for the current hour (see `WIND_CLUMP_CACHE`),
+    so repeated regeneration within that window stays off the network. Pass
+    `use_cache=False` to force a live fetch. By default requests go through
+    the shared keep-alive session; pass `session` to substitute your own
+    (tests, custom proxies).
+    """
+    cache_file = _cache_path(location, units) if use_cache else None
+    if cache_file is not None:
+        cached = _read_cached_wind(cache_file)
+        if cached is not None:
+            return cached
+
+    wind = _fetch_wind_live(
+        location=location,
+        api_key=api_key,
+        units=units,
+        timeout=timeout,
+        session=session,
+    )
+
+    if cache_file is not None:
+        _write_cached_wind(cache_file, wind)
+    return wind
+
+
+def _fetch_wind_live(
+    location: str,
+    api_key: str,
+    units: str,
+    timeout: float,
+    session: requests.Session | None = None,
 ) -> WindData:
-    """Fetch current wind speed and direction for a city from OpenWeatherMap."""
     if not api_key:
         raise WindAPIError(
             "No OpenWeatherMap API key provided. "
@@ -47,15 +171,16 @@ def fetch_wind_for_city(
         "units": units,
     }
 
+    http = session if session is not None else _SESSION
     try:
-        response = requests.get(OPENWEATHER_URL, params=params, timeout=timeout)
+        response = http.get(OPENWEATHER_URL, params=params, timeout=timeout)
     except requests.RequestException as exc:
         raise WindAPIError(f"Error contacting OpenWeatherMap: {exc}") from exc
 
     if response.status_code != 200:
         message: str | None = None
         try:
-            payload: Any = response.json()
+            payload: Any = _decode_json(response)
             if isinstance(payload, dict):
                 api_message = payload.get("message")
                 api_code = payload.get("cod")
@@ -65,7 +190,9 @@ def fetch_wind_for_city(
             message = None
 
         if not message:
-            snippet = response.text.strip()
+            # Decode at most 256 bytes of the body; error pages from proxies
+            # can be arbitrarily large and we only want a short excerpt.
+            snippet = response.content[:256].decode("utf-8", errors="replace").strip()
             if len(snippet) > 120:
                 snippet = snippet[:117] + "..."
             message = f"HTTP {response.status_code}: {snippet or 'unknown error'}"
@@ -73,10 +200,15 @@ def fetch_wind_for_city(
         raise WindAPIError(f"OpenWeatherMap request failed: {message}")
 
     try:
-        data: Any = response.json()
+        data: Any = _decode_json(response)
     except ValueError as exc:
         raise WindAPIError("API returned invalid JSON.") from exc
 
+    return _parse_wind_payload(data, units=units)
+
+
+def _parse_wind_payload(data: Any, units: str) -> WindData:
+    """Validate a decoded OpenWeatherMap payload and extract the wind."""
     if not isinstance(data, dict):
         raise WindAPIError("Unexpected JSON structure from API (expected an object).")
 
@@ -92,7 +224,7 @@ def fetch_wind_for_city(
     except (TypeError, ValueError) as exc:
         raise WindAPIError(f"API returned non-numeric wind speed: {speed_raw!r}") from exc
 
-    speed_mps = max(0.0, _convert_speed_to_mps(speed_value, units=units))
+    speed_mps = _convert_speed_to_mps(speed_value, units=units)
 
     direction_raw = wind.get("deg")
     if direction_raw is None:
@@ -104,3 +236,36 @@ def fetch_wind_for_city(
             direction_deg = None
 
     return WindData(speed_mps=speed_mps, direction_deg=direction_deg)
+
+
+async def fetch_wind_for_cities(
+    locations: Iterable[str],
+    api_key: str,
+    units: str = "metric",
+    timeout: float = 10.0,
+    use_cache: bool = True,
+) -> list[WindData | WindAPIError]:
+    """Fetch wind for many cities concurrently.
+
+    Runs the pooled sync fetch on worker threads via asyncio, so N cities
+    cost roughly one round-trip instead of N. Errors are isolated per city:
+    the result list holds a `WindData` or the `WindAPIError` that position
+    raised, in input order. (The transport stays `requests` — this tree has
+    no async HTTP dependency — but the shared session keeps connections
+    warm across the batch.)
+    """
+
+    async def _fetch_one(location: str) -> WindData | WindAPIError:
+        try:
+            return await asyncio.to_thread(
+                fetch_wind_for_city,
+                location,
+                api_key,
+                units,
+                timeout,
+                use_cache,
+            )
+        except WindAPIError as exc:
+            return exc
+
+    return list(await asyncio.gather(*(_fetch_one(location) for location in locations)))